@@ -1,10 +1,90 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+
+import numpy as np
+import openpyxl
 import pandas as pd
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+# Cell text that pd.read_excel() reads as missing by default
+default_na_values = ["", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN", "<NA>",
+                     "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null"]
+
+
+def read_excel_sheet(path, sheet_name, usecols=None, nrows=None, skiprows=0):
+    """
+    Stream one worksheet into a data frame without loading the whole workbook.
+
+    The workbook is opened in read-only mode, so openpyxl hands back rows lazily instead of building every cell in
+    memory. The row after skiprows is the header. usecols (names or positions) and nrows are pushed down into the
+    row loop, so unwanted cells and rows are never copied into the data frame.
+    """
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        max_row = None if nrows is None else skiprows + 1 + nrows
+        rows = workbook[sheet_name].iter_rows(min_row=skiprows + 1, max_row=max_row, values_only=True)
+        header = next(rows)
+        if usecols is None:
+            indices = range(len(header))
+        else:
+            indices = [col if isinstance(col, int) else header.index(col) for col in usecols]
+        records = [tuple(row[i] for i in indices) for row in islice(rows, nrows)]
+        data = pd.DataFrame.from_records(records, columns=[header[i] for i in indices])
+    finally:
+        workbook.close()
+
+    # Empty cells come back as None, which leaves numeric columns as object; treat missing-value text and empty cells
+    # the way pd.read_excel() does, so columns get the same types, with entirely empty columns as float64 NaN
+    data = data.mask(data.isna() | data.isin(default_na_values), np.nan).infer_objects()
+    empty = [column for column in data if data[column].isna().all()]
+    return data.astype({column: "float64" for column in empty})
+
+
+def read_excel_sheets(path, sheet_names=None, max_workers=None, **kwargs):
+    """
+    Read several worksheets concurrently, one sheet per worker process.
+
+    Returns a dictionary of data frames keyed by sheet name, like pd.read_excel(sheet_name=None). Any extra keyword
+    arguments (usecols, nrows, skiprows) are passed on to read_excel_sheet() for every sheet.
+    """
+    if sheet_names is None:
+        workbook = openpyxl.load_workbook(path, read_only=True)
+        sheet_names = workbook.sheetnames
+        workbook.close()
+
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        frames = executor.map(partial(read_excel_sheet, path, **kwargs), sheet_names)
+        return dict(zip(sheet_names, frames))
+
+
+def get_data_from_one_sheet():
+    # The first two rows of each sheet are a title and a source line, so skip them to reach the header
+    survey_data = read_excel_sheet("data/fcc-new-coder-survey.xlsx", "2016", skiprows=2)
+    print(survey_data.head())
+
+
+def get_data_from_all_sheets():
+    # Read both survey years in parallel, only loading the columns and rows we need
+    survey_responses = read_excel_sheets("data/fcc-new-coder-survey.xlsx",
+                                         usecols=["Age", "ExpectedEarning", "HasDebt"],
+                                         nrows=1000,
+                                         skiprows=2)
+    for year, responses in survey_responses.items():
+        print(year, responses.shape)
+
+    # Stack the years together and plot expected earnings by age
+    all_responses = pd.concat([responses.assign(Year=year) for year, responses in survey_responses.items()],
+                              ignore_index=True)
+    sns.scatterplot(data=all_responses, x="Age", y="ExpectedEarning", hue="Year")
+    plt.show()
+
 
 def main():
-    pass
+    sns.set()
+    get_data_from_one_sheet()
+    get_data_from_all_sheets()
 
 
 if __name__ == '__main__':
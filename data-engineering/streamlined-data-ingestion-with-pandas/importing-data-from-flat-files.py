@@ -1,4 +1,10 @@
+import json
+import os
+
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.feather as feather
 import matplotlib.pyplot as plt
 import seaborn as sns
 
@@ -36,10 +42,141 @@ def get_data_from_other_flat_files():
     plt.show()
 
 
+def sum_by_group_in_chunks(path, by, column, chunksize=10000):
+    """
+    Stream a flat file in bounded chunks and sum one column per group.
+
+    Each chunk only loads the two columns we need, builds its own partial groupby sum and is merged into the running
+    total, so peak memory is one chunk no matter how big the file is. Unlike paging with nrows/skiprows, the reader
+    keeps its place in the file and never re-scans it from the top.
+    """
+    totals = None
+    for chunk in pd.read_csv(path, usecols=[by, column], chunksize=chunksize):
+        partial = chunk.groupby(by)[column].sum()
+        totals = partial if totals is None else totals.add(partial, fill_value=0)
+    return totals.astype(partial.dtype).sort_index()
+
+
+def get_data_from_flat_files_in_chunks():
+    # Sum the number of tax returns by income group without loading the whole file
+    counts = sum_by_group_in_chunks("data/vt_tax_data_2016.csv", "agi_stub", "N1", chunksize=500)
+    print(counts)
+
+    # Plot the total number of tax returns by income group
+    counts.plot.bar()
+    plt.show()
+
+
+def narrowest_dtype(column, category_ratio=0.5):
+    """
+    Pick the narrowest dtype that holds every value of an already parsed column.
+
+    Integers are downcast to the smallest int width, floats only go to float32 when that round-trips exactly, and
+    text columns with few distinct values relative to their length become categories.
+    """
+    if pd.api.types.is_integer_dtype(column):
+        return str(pd.to_numeric(column, downcast="integer").dtype)
+    if pd.api.types.is_float_dtype(column):
+        narrow = column.astype(np.float32)
+        if narrow.astype(column.dtype).equals(column):
+            return "float32"
+        return str(column.dtype)
+    if pd.api.types.is_string_dtype(column) and len(column):
+        if column.nunique() / len(column) <= category_ratio:
+            return "category"
+    return str(column.dtype)
+
+
+def read_csv_with_schema_cache(path, usecols=None, **kwargs):
+    """
+    Read a CSV using a cached schema so pandas skips dtype inference on repeat loads.
+
+    The first load parses the whole file, works out the narrowest dtype of every column and stores it in a JSON file
+    next to the CSV. The cache is keyed by the file's size and mtime plus the read options, so it is rebuilt whenever
+    the file or the way we read it changes. The schema is always inferred without the caller's dtype, so it is the same
+    whichever call built it, and any dtype passed in by the caller is then applied on top of it.
+    """
+    dtype = kwargs.pop("dtype", None) or {}
+    options = repr(sorted((key, repr(value)) for key, value in kwargs.items()))
+    stat = os.stat(path)
+    cache_path = path + ".schema.json"
+
+    schema = None
+    if os.path.exists(cache_path):
+        with open(cache_path) as cache_file:
+            cached = json.load(cache_file)
+        if (cached["size"], cached["mtime_ns"], cached["options"]) == (stat.st_size, stat.st_mtime_ns, options):
+            schema = cached["dtypes"]
+
+    if schema is None:
+        data = pd.read_csv(path, **kwargs)
+        schema = {column: narrowest_dtype(data[column]) for column in data}
+        with open(cache_path, "w") as cache_file:
+            json.dump({"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "options": options, "dtypes": schema},
+                      cache_file)
+
+    dtypes = {**schema, **dtype}
+    if usecols is not None:
+        dtypes = {column: dtypes[column] for column in usecols if column in dtypes}
+    return pd.read_csv(path, usecols=usecols, dtype=dtypes, **kwargs)
+
+
+def get_data_from_csvs_with_schema_cache():
+    # The first call infers and caches the schema, later calls load straight into narrow columns
+    data = read_csv_with_schema_cache("data/vt_tax_data_2016.csv", dtype={"zipcode": str})
+    data = read_csv_with_schema_cache("data/vt_tax_data_2016.csv", dtype={"zipcode": str})
+    print(data.dtypes)
+    print(data.memory_usage(deep=True).sum())
+
+    # Column projection still works on top of the cached schema
+    data = read_csv_with_schema_cache("data/vt_tax_data_2016.csv",
+                                      usecols=["zipcode", "agi_stub", "N1"],
+                                      dtype={"zipcode": str})
+    print(data.head())
+
+
+def read_csv_with_sidecar(path, usecols=None, **kwargs):
+    """
+    Read a CSV through an uncompressed Feather sidecar so later reads skip text parsing entirely.
+
+    The first read parses the CSV (with the cached narrow schema) and writes every column to a .feather file next to
+    it, tagged with the source's size, mtime and read options. Later reads memory-map the sidecar and only load the
+    projected columns. A sidecar whose tags no longer match the source is rebuilt.
+    """
+    stat = os.stat(path)
+    options = repr(sorted((key, repr(value)) for key, value in kwargs.items()))
+    source = {b"size": str(stat.st_size).encode(), b"mtime_ns": str(stat.st_mtime_ns).encode(), b"options": options.encode()}
+    sidecar_path = path + ".feather"
+
+    if os.path.exists(sidecar_path):
+        with pa.memory_map(sidecar_path) as sidecar:
+            metadata = pa.ipc.open_file(sidecar).schema.metadata or {}
+        if all(metadata.get(key) == value for key, value in source.items()):
+            table = feather.read_table(sidecar_path, columns=usecols, memory_map=True)
+            return table.to_pandas()
+
+    data = read_csv_with_schema_cache(path, **kwargs)
+    table = pa.Table.from_pandas(data, preserve_index=False)
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **source})
+    feather.write_feather(table, sidecar_path, compression="uncompressed")
+    return data if usecols is None else data[list(usecols)]
+
+
+def get_data_from_csvs_with_sidecar():
+    # The first read writes the sidecar, the second one memory-maps it and only loads three columns
+    data = read_csv_with_sidecar("data/vt_tax_data_2016.csv", dtype={"zipcode": str})
+    data = read_csv_with_sidecar("data/vt_tax_data_2016.csv", usecols=["zipcode", "agi_stub", "N1"], dtype={"zipcode": str})
+    print(data.dtypes)
+    print(data.head())
+
+
 def main():
     sns.set()
     get_data_from_csvs()
     get_data_from_other_flat_files()
+    get_data_from_flat_files_in_chunks()
+    get_data_from_csvs_with_schema_cache()
+    get_data_from_csvs_with_sidecar()
 
 
 if __name__ == '__main__':
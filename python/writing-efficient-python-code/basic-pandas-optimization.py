@@ -1,121 +1,170 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from multiprocessing import shared_memory
+
 import numpy as np
 import pandas as pd
 
 columns = ['Team', 'League', 'Year', 'RS', 'RA', 'W', 'G', 'Playoffs']
 
-pit_df = pd.DataFrame(np.array([
+# Narrowest types that hold a team season; RS and RA stay int32 so RS ** 2 can't overflow
+column_dtypes = {'Team': 'category', 'League': 'category', 'Year': 'int16', 'RS': 'int32', 'RA': 'int32',
+                 'W': 'int16', 'G': 'int16', 'Playoffs': 'int8'}
+
+
+def team_seasons_df(rows, columns=columns):
+    """
+    Build a team-season DataFrame with typed columns.
+
+    Going through np.array() would turn a mix of team names and numbers into one array of strings, so instead every
+    column keeps its own type: small ints for the stats and categories for Team and League.
+    """
+    df = pd.DataFrame(rows, columns=columns)
+    return df.astype({column: column_dtypes[column] for column in columns})
+
+
+pit_df = team_seasons_df([
     ['PIT', 'NL', 2012, 651, 674, 79, 162, 0],
     ['PIT', 'NL', 2011, 610, 712, 72, 162, 0],
     ['PIT', 'NL', 2010, 587, 866, 57, 162, 0],
     ['PIT', 'NL', 2009, 636, 768, 62, 161, 0],
     ['PIT', 'NL', 2008, 735, 884, 67, 162, 0]
-]), columns=columns)
-rangers_df = pd.DataFrame(np.array([['TEX', 'AL', 2012, 808, 707, 93, 162, 1],
-                                    ['TEX', 'AL', 2011, 855, 677, 96, 162, 1],
-                                    ['TEX', 'AL', 2010, 787, 687, 90, 162, 1],
-                                    ['TEX', 'AL', 2009, 784, 740, 87, 162, 0],
-                                    ['TEX', 'AL', 2008, 901, 967, 79, 162, 0],
-                                    ['TEX', 'AL', 2007, 816, 844, 75, 162, 0],
-                                    ['TEX', 'AL', 2006, 835, 784, 80, 162, 0],
-                                    ['TEX', 'AL', 2005, 865, 858, 79, 162, 0],
-                                    ['TEX', 'AL', 2004, 860, 794, 89, 162, 0],
-                                    ['TEX', 'AL', 2003, 826, 969, 71, 162, 0],
-                                    ['TEX', 'AL', 2002, 843, 882, 72, 162, 0],
-                                    ['TEX', 'AL', 2001, 890, 968, 73, 162, 0],
-                                    ['TEX', 'AL', 2000, 848, 974, 71, 162, 0],
-                                    ['TEX', 'AL', 1999, 945, 859, 95, 162, 1],
-                                    ['TEX', 'AL', 1998, 940, 871, 88, 162, 1],
-                                    ['TEX', 'AL', 1997, 807, 823, 77, 162, 0],
-                                    ['TEX', 'AL', 1996, 928, 799, 90, 163, 1],
-                                    ['TEX', 'AL', 1993, 835, 751, 86, 162, 0],
-                                    ['TEX', 'AL', 1992, 682, 753, 77, 162, 0],
-                                    ['TEX', 'AL', 1991, 829, 814, 85, 162, 0],
-                                    ['TEX', 'AL', 1990, 676, 696, 83, 162, 0],
-                                    ['TEX', 'AL', 1989, 695, 714, 83, 162, 0],
-                                    ['TEX', 'AL', 1988, 637, 735, 70, 161, 0],
-                                    ['TEX', 'AL', 1987, 823, 849, 75, 162, 0],
-                                    ['TEX', 'AL', 1986, 771, 743, 87, 162, 0],
-                                    ['TEX', 'AL', 1985, 617, 785, 62, 161, 0],
-                                    ['TEX', 'AL', 1984, 656, 714, 69, 161, 0],
-                                    ['TEX', 'AL', 1983, 639, 609, 77, 163, 0],
-                                    ['TEX', 'AL', 1982, 590, 749, 64, 162, 0],
-                                    ['TEX', 'AL', 1980, 756, 752, 76, 163, 0],
-                                    ['TEX', 'AL', 1979, 750, 698, 83, 162, 0],
-                                    ['TEX', 'AL', 1978, 692, 632, 87, 162, 0],
-                                    ['TEX', 'AL', 1977, 767, 657, 94, 162, 0],
-                                    ['TEX', 'AL', 1976, 616, 652, 76, 162, 0],
-                                    ['TEX', 'AL', 1975, 714, 733, 79, 162, 0],
-                                    ['TEX', 'AL', 1974, 690, 698, 83, 161, 0],
-                                    ['TEX', 'AL', 1973, 619, 844, 57, 162, 0]]), columns=columns)
-yankees_df = pd.DataFrame(np.array([['NYY', 'AL', 2012, 804, 668, 95, 162, 1],
-                                    ['NYY', 'AL', 2011, 867, 657, 97, 162, 1],
-                                    ['NYY', 'AL', 2010, 859, 693, 95, 162, 1],
-                                    ['NYY', 'AL', 2009, 915, 753, 103, 162, 1],
-                                    ['NYY', 'AL', 2008, 789, 727, 89, 162, 0],
-                                    ['NYY', 'AL', 2007, 968, 777, 94, 162, 1],
-                                    ['NYY', 'AL', 2006, 930, 767, 97, 162, 1],
-                                    ['NYY', 'AL', 2005, 886, 789, 95, 162, 1],
-                                    ['NYY', 'AL', 2004, 897, 808, 101, 162, 1],
-                                    ['NYY', 'AL', 2003, 877, 716, 101, 163, 1],
-                                    ['NYY', 'AL', 2002, 897, 697, 103, 161, 1],
-                                    ['NYY', 'AL', 2001, 804, 713, 95, 161, 1],
-                                    ['NYY', 'AL', 2000, 871, 814, 87, 161, 1],
-                                    ['NYY', 'AL', 1999, 900, 731, 98, 162, 1],
-                                    ['NYY', 'AL', 1998, 965, 656, 114, 162, 1],
-                                    ['NYY', 'AL', 1997, 891, 688, 96, 162, 1],
-                                    ['NYY', 'AL', 1996, 871, 787, 92, 162, 1],
-                                    ['NYY', 'AL', 1993, 821, 761, 88, 162, 0],
-                                    ['NYY', 'AL', 1992, 733, 746, 76, 162, 0],
-                                    ['NYY', 'AL', 1991, 674, 777, 71, 162, 0],
-                                    ['NYY', 'AL', 1990, 603, 749, 67, 162, 0],
-                                    ['NYY', 'AL', 1989, 698, 792, 74, 161, 0],
-                                    ['NYY', 'AL', 1988, 772, 748, 85, 161, 0],
-                                    ['NYY', 'AL', 1987, 788, 758, 89, 162, 0],
-                                    ['NYY', 'AL', 1986, 797, 738, 90, 162, 0],
-                                    ['NYY', 'AL', 1985, 839, 660, 97, 161, 0],
-                                    ['NYY', 'AL', 1984, 758, 679, 87, 162, 0],
-                                    ['NYY', 'AL', 1983, 770, 703, 91, 162, 0],
-                                    ['NYY', 'AL', 1982, 709, 716, 79, 162, 0],
-                                    ['NYY', 'AL', 1980, 820, 662, 103, 162, 1],
-                                    ['NYY', 'AL', 1979, 734, 672, 89, 160, 0],
-                                    ['NYY', 'AL', 1978, 735, 582, 100, 163, 1],
-                                    ['NYY', 'AL', 1977, 831, 651, 100, 162, 1],
-                                    ['NYY', 'AL', 1976, 730, 575, 97, 159, 1],
-                                    ['NYY', 'AL', 1975, 681, 588, 83, 160, 0],
-                                    ['NYY', 'AL', 1974, 671, 623, 89, 162, 0],
-                                    ['NYY', 'AL', 1973, 641, 610, 80, 162, 0],
-                                    ['NYY', 'AL', 1971, 648, 641, 81, 162, 0],
-                                    ['NYY', 'AL', 1970, 680, 612, 93, 163, 0],
-                                    ['NYY', 'AL', 1969, 562, 587, 80, 162, 0],
-                                    ['NYY', 'AL', 1968, 536, 531, 83, 164, 0],
-                                    ['NYY', 'AL', 1967, 522, 621, 72, 163, 0],
-                                    ['NYY', 'AL', 1966, 611, 612, 70, 160, 0],
-                                    ['NYY', 'AL', 1965, 611, 604, 77, 162, 0],
-                                    ['NYY', 'AL', 1964, 730, 577, 99, 164, 1],
-                                    ['NYY', 'AL', 1963, 714, 547, 104, 161, 1],
-                                    ['NYY', 'AL', 1962, 817, 680, 96, 162, 1]]), columns=columns)
-rays_df = pd.DataFrame(np.array([[697, 577, 90, 0],
-                                 [707, 614, 91, 1],
-                                 [802, 649, 96, 1],
-                                 [803, 754, 84, 0],
-                                 [774, 671, 97, 1]]), columns=['RS', 'RA', 'W', 'Playoffs'])
+])
+rangers_df = team_seasons_df([['TEX', 'AL', 2012, 808, 707, 93, 162, 1],
+                              ['TEX', 'AL', 2011, 855, 677, 96, 162, 1],
+                              ['TEX', 'AL', 2010, 787, 687, 90, 162, 1],
+                              ['TEX', 'AL', 2009, 784, 740, 87, 162, 0],
+                              ['TEX', 'AL', 2008, 901, 967, 79, 162, 0],
+                              ['TEX', 'AL', 2007, 816, 844, 75, 162, 0],
+                              ['TEX', 'AL', 2006, 835, 784, 80, 162, 0],
+                              ['TEX', 'AL', 2005, 865, 858, 79, 162, 0],
+                              ['TEX', 'AL', 2004, 860, 794, 89, 162, 0],
+                              ['TEX', 'AL', 2003, 826, 969, 71, 162, 0],
+                              ['TEX', 'AL', 2002, 843, 882, 72, 162, 0],
+                              ['TEX', 'AL', 2001, 890, 968, 73, 162, 0],
+                              ['TEX', 'AL', 2000, 848, 974, 71, 162, 0],
+                              ['TEX', 'AL', 1999, 945, 859, 95, 162, 1],
+                              ['TEX', 'AL', 1998, 940, 871, 88, 162, 1],
+                              ['TEX', 'AL', 1997, 807, 823, 77, 162, 0],
+                              ['TEX', 'AL', 1996, 928, 799, 90, 163, 1],
+                              ['TEX', 'AL', 1993, 835, 751, 86, 162, 0],
+                              ['TEX', 'AL', 1992, 682, 753, 77, 162, 0],
+                              ['TEX', 'AL', 1991, 829, 814, 85, 162, 0],
+                              ['TEX', 'AL', 1990, 676, 696, 83, 162, 0],
+                              ['TEX', 'AL', 1989, 695, 714, 83, 162, 0],
+                              ['TEX', 'AL', 1988, 637, 735, 70, 161, 0],
+                              ['TEX', 'AL', 1987, 823, 849, 75, 162, 0],
+                              ['TEX', 'AL', 1986, 771, 743, 87, 162, 0],
+                              ['TEX', 'AL', 1985, 617, 785, 62, 161, 0],
+                              ['TEX', 'AL', 1984, 656, 714, 69, 161, 0],
+                              ['TEX', 'AL', 1983, 639, 609, 77, 163, 0],
+                              ['TEX', 'AL', 1982, 590, 749, 64, 162, 0],
+                              ['TEX', 'AL', 1980, 756, 752, 76, 163, 0],
+                              ['TEX', 'AL', 1979, 750, 698, 83, 162, 0],
+                              ['TEX', 'AL', 1978, 692, 632, 87, 162, 0],
+                              ['TEX', 'AL', 1977, 767, 657, 94, 162, 0],
+                              ['TEX', 'AL', 1976, 616, 652, 76, 162, 0],
+                              ['TEX', 'AL', 1975, 714, 733, 79, 162, 0],
+                              ['TEX', 'AL', 1974, 690, 698, 83, 161, 0],
+                              ['TEX', 'AL', 1973, 619, 844, 57, 162, 0]])
+yankees_df = team_seasons_df([['NYY', 'AL', 2012, 804, 668, 95, 162, 1],
+                              ['NYY', 'AL', 2011, 867, 657, 97, 162, 1],
+                              ['NYY', 'AL', 2010, 859, 693, 95, 162, 1],
+                              ['NYY', 'AL', 2009, 915, 753, 103, 162, 1],
+                              ['NYY', 'AL', 2008, 789, 727, 89, 162, 0],
+                              ['NYY', 'AL', 2007, 968, 777, 94, 162, 1],
+                              ['NYY', 'AL', 2006, 930, 767, 97, 162, 1],
+                              ['NYY', 'AL', 2005, 886, 789, 95, 162, 1],
+                              ['NYY', 'AL', 2004, 897, 808, 101, 162, 1],
+                              ['NYY', 'AL', 2003, 877, 716, 101, 163, 1],
+                              ['NYY', 'AL', 2002, 897, 697, 103, 161, 1],
+                              ['NYY', 'AL', 2001, 804, 713, 95, 161, 1],
+                              ['NYY', 'AL', 2000, 871, 814, 87, 161, 1],
+                              ['NYY', 'AL', 1999, 900, 731, 98, 162, 1],
+                              ['NYY', 'AL', 1998, 965, 656, 114, 162, 1],
+                              ['NYY', 'AL', 1997, 891, 688, 96, 162, 1],
+                              ['NYY', 'AL', 1996, 871, 787, 92, 162, 1],
+                              ['NYY', 'AL', 1993, 821, 761, 88, 162, 0],
+                              ['NYY', 'AL', 1992, 733, 746, 76, 162, 0],
+                              ['NYY', 'AL', 1991, 674, 777, 71, 162, 0],
+                              ['NYY', 'AL', 1990, 603, 749, 67, 162, 0],
+                              ['NYY', 'AL', 1989, 698, 792, 74, 161, 0],
+                              ['NYY', 'AL', 1988, 772, 748, 85, 161, 0],
+                              ['NYY', 'AL', 1987, 788, 758, 89, 162, 0],
+                              ['NYY', 'AL', 1986, 797, 738, 90, 162, 0],
+                              ['NYY', 'AL', 1985, 839, 660, 97, 161, 0],
+                              ['NYY', 'AL', 1984, 758, 679, 87, 162, 0],
+                              ['NYY', 'AL', 1983, 770, 703, 91, 162, 0],
+                              ['NYY', 'AL', 1982, 709, 716, 79, 162, 0],
+                              ['NYY', 'AL', 1980, 820, 662, 103, 162, 1],
+                              ['NYY', 'AL', 1979, 734, 672, 89, 160, 0],
+                              ['NYY', 'AL', 1978, 735, 582, 100, 163, 1],
+                              ['NYY', 'AL', 1977, 831, 651, 100, 162, 1],
+                              ['NYY', 'AL', 1976, 730, 575, 97, 159, 1],
+                              ['NYY', 'AL', 1975, 681, 588, 83, 160, 0],
+                              ['NYY', 'AL', 1974, 671, 623, 89, 162, 0],
+                              ['NYY', 'AL', 1973, 641, 610, 80, 162, 0],
+                              ['NYY', 'AL', 1971, 648, 641, 81, 162, 0],
+                              ['NYY', 'AL', 1970, 680, 612, 93, 163, 0],
+                              ['NYY', 'AL', 1969, 562, 587, 80, 162, 0],
+                              ['NYY', 'AL', 1968, 536, 531, 83, 164, 0],
+                              ['NYY', 'AL', 1967, 522, 621, 72, 163, 0],
+                              ['NYY', 'AL', 1966, 611, 612, 70, 160, 0],
+                              ['NYY', 'AL', 1965, 611, 604, 77, 162, 0],
+                              ['NYY', 'AL', 1964, 730, 577, 99, 164, 1],
+                              ['NYY', 'AL', 1963, 714, 547, 104, 161, 1],
+                              ['NYY', 'AL', 1962, 817, 680, 96, 162, 1]])
+rays_df = team_seasons_df([[697, 577, 90, 0],
+                           [707, 614, 91, 1],
+                           [802, 649, 96, 1],
+                           [803, 754, 84, 0],
+                           [774, 671, 97, 1]], columns=['RS', 'RA', 'W', 'Playoffs'])
 rays_idx = [2012, 2011, 2010, 2009, 2008]
 rays_df.index = rays_idx
-dbacks_df = pd.DataFrame(np.array([['ARI', 'NL', 2012, 734, 688, 81, 162, 0],
-                                   ['ARI', 'NL', 2011, 731, 662, 94, 162, 1],
-                                   ['ARI', 'NL', 2010, 713, 836, 65, 162, 0],
-                                   ['ARI', 'NL', 2009, 720, 782, 70, 162, 0],
-                                   ['ARI', 'NL', 2008, 720, 706, 82, 162, 0],
-                                   ['ARI', 'NL', 2007, 712, 732, 90, 162, 1],
-                                   ['ARI', 'NL', 2006, 773, 788, 76, 162, 0],
-                                   ['ARI', 'NL', 2005, 696, 856, 77, 162, 0],
-                                   ['ARI', 'NL', 2004, 615, 899, 51, 162, 0],
-                                   ['ARI', 'NL', 2003, 717, 685, 84, 162, 0],
-                                   ['ARI', 'NL', 2002, 819, 674, 98, 162, 1],
-                                   ['ARI', 'NL', 2001, 818, 677, 92, 162, 1],
-                                   ['ARI', 'NL', 2000, 792, 754, 85, 162, 0],
-                                   ['ARI', 'NL', 1999, 908, 676, 100, 162, 1],
-                                   ['ARI', 'NL', 1998, 665, 812, 65, 162, 0]]), columns=columns)
+dbacks_df = team_seasons_df([['ARI', 'NL', 2012, 734, 688, 81, 162, 0],
+                             ['ARI', 'NL', 2011, 731, 662, 94, 162, 1],
+                             ['ARI', 'NL', 2010, 713, 836, 65, 162, 0],
+                             ['ARI', 'NL', 2009, 720, 782, 70, 162, 0],
+                             ['ARI', 'NL', 2008, 720, 706, 82, 162, 0],
+                             ['ARI', 'NL', 2007, 712, 732, 90, 162, 1],
+                             ['ARI', 'NL', 2006, 773, 788, 76, 162, 0],
+                             ['ARI', 'NL', 2005, 696, 856, 77, 162, 0],
+                             ['ARI', 'NL', 2004, 615, 899, 51, 162, 0],
+                             ['ARI', 'NL', 2003, 717, 685, 84, 162, 0],
+                             ['ARI', 'NL', 2002, 819, 674, 98, 162, 1],
+                             ['ARI', 'NL', 2001, 818, 677, 92, 162, 1],
+                             ['ARI', 'NL', 2000, 792, 754, 85, 162, 0],
+                             ['ARI', 'NL', 1999, 908, 676, 100, 162, 1],
+                             ['ARI', 'NL', 1998, 665, 812, 65, 162, 0]])
+
+# Row functions registered with row_kernel(), keyed by function name
+row_kernels = {}
+
+
+def row_kernel(*columns, vectorized=None):
+    """
+    Register a row function together with the columns it reads and a whole-column version of it.
+
+    The scalar function is returned unchanged, so it can still be called once per row. vectorized takes one NumPy array
+    per column and must return the same values as calling the scalar function on every row; leave it out when the
+    scalar function already works on arrays.
+    """
+    def decorator(func):
+        row_kernels[func.__name__] = (func, columns, vectorized or func)
+        return func
+    return decorator
+
+
+def apply_row_kernel(name, df, vectorized=True):
+    """
+    Run a registered row kernel over a DataFrame, as whole-column NumPy operations by default.
+
+    Pass vectorized=False to call the scalar function once per row instead, e.g. to check the two paths agree.
+    """
+    func, columns, vectorized_func = row_kernels[name]
+    if vectorized:
+        return vectorized_func(*(df[column].values for column in columns))
+    return np.array([func(*row) for row in df[list(columns)].itertuples(index=False)])
 
 
 def iterating_with_iterrows():
@@ -131,11 +180,17 @@ def iterating_with_iterrows():
         print(type(row_tuple))
 
 
+@row_kernel('W', 'G')
 def calc_win_perc(wins, games_played):
     win_perc = wins / games_played
     return np.round(win_perc, 2)
 
 
+def calc_run_diff_np(runs_scored, runs_allowed):
+    return runs_scored.astype(int) - runs_allowed.astype(int)
+
+
+@row_kernel('RS', 'RA', vectorized=calc_run_diff_np)
 def calc_run_diff(runs_scored, runs_allowed):
     rs = int(runs_scored)
     ra = int(runs_allowed)
@@ -144,12 +199,11 @@ def calc_run_diff(runs_scored, runs_allowed):
 
 
 def run_differentials_with_iterrows():
-    columns = ['Team', 'League', 'Year', 'RS', 'RA', 'W', 'G', 'Playoffs']
-    giants_df = pd.DataFrame(np.array([['SFG', 'NL', 2012, 718, 649, 94, 162, 1],
-                                       ['SFG', 'NL', 2011, 570, 578, 86, 162, 0],
-                                       ['SFG', 'NL', 2010, 697, 583, 92, 162, 1],
-                                       ['SFG', 'NL', 2009, 657, 611, 88, 162, 0],
-                                       ['SFG', 'NL', 2008, 640, 759, 72, 162, 0]]), columns=columns)
+    giants_df = team_seasons_df([['SFG', 'NL', 2012, 718, 649, 94, 162, 1],
+                                 ['SFG', 'NL', 2011, 570, 578, 86, 162, 0],
+                                 ['SFG', 'NL', 2010, 697, 583, 92, 162, 1],
+                                 ['SFG', 'NL', 2009, 657, 611, 88, 162, 0],
+                                 ['SFG', 'NL', 2008, 640, 759, 72, 162, 0]])
     # Create an empty list to store run differentials
     run_diffs = []
 
@@ -181,7 +235,7 @@ def iterating_with_itertuples():
         # print(i, year, wins)
 
         # Check if rangers made Playoffs (1 means yes; 0 means no)
-        if row.Playoffs == '1':
+        if row.Playoffs == 1:
             print(i, year, wins)
 
 
@@ -202,6 +256,11 @@ def run_differentials_with_itertuples():
     print(yankees_df)
 
 
+def text_playoffs_np(num_playoffs):
+    return np.where(num_playoffs == 1, 'Yes', 'No')
+
+
+@row_kernel('Playoffs', vectorized=text_playoffs_np)
 def text_playoffs(num_playoffs):
     if num_playoffs == 1:
         return 'Yes'
@@ -239,9 +298,37 @@ def settle_a_debate_with_apply():
     print(dbacks_df[dbacks_df['WP'] >= 0.50])
 
 
+def detect_line_terminator(path, sample_size=65536):
+    """
+    Sniff the line terminator from the start of a file.
+
+    Returns '\\r' for files that end lines with a bare carriage return (old Mac style, like baseball_stats.csv) and None
+    for '\\n' or '\\r\\n' files, which the C parser already handles by default.
+    """
+    with open(path, 'rb') as f:
+        sample = f.read(sample_size)
+    if b'\r' in sample and b'\n' not in sample:
+        return '\r'
+    return None
+
+
+@lru_cache()
+def read_baseball_stats(path='baseball_stats.csv'):
+    """
+    Load baseball_stats.csv once, with typed columns, and hand the same DataFrame to every caller.
+
+    The file is streamed straight through the C parser with its real line terminator, so nothing has to re-decode
+    universal newlines. Callers that add columns should work on a .copy().
+    """
+    baseball_df = pd.read_csv(path,
+                              engine='c',
+                              lineterminator=detect_line_terminator(path),
+                              dtype=column_dtypes)
+    return baseball_df
+
+
 def replacing_iloc_with_underlying_arrays():
-    baseball_df = pd.read_csv('baseball_stats.csv',
-                              dtype={0: 'object', 1: 'object', 2: 'float64', 3: 'float64', 4: 'float64', 5: 'float64', 6: 'float64', 7: 'float64'})
+    baseball_df = read_baseball_stats().copy()
 
     # Use the W array and G array to calculate win percentages
     win_percs_np = calc_win_perc(baseball_df['W'].values, baseball_df['G'].values)
@@ -252,15 +339,14 @@ def replacing_iloc_with_underlying_arrays():
     print(baseball_df.head())
 
 
-def predict_win_perc(RS, RA):
-    prediction = RS ** 2 / (RS ** 2 + RA ** 2)
+@row_kernel('RS', 'RA')
+def predict_win_perc(RS, RA, exponent=2):
+    prediction = RS ** exponent / (RS ** exponent + RA ** exponent)
     return np.round(prediction, 2)
 
 
 def bringing_it_all_together_predict_win_percentage():
-    baseball_df = pd.read_csv('baseball_stats.csv',
-                              dtype={0: 'object', 1: 'object', 2: 'float64', 3: 'float64', 4: 'float64', 5: 'float64', 6: 'float64',
-                                     7: 'float64'})
+    baseball_df = read_baseball_stats().copy()
     win_perc_preds_loop = []
 
     # Use a loop and .itertuples() to collect each row's predicted win percentage
@@ -279,6 +365,78 @@ def bringing_it_all_together_predict_win_percentage():
     print(baseball_df.head())
 
 
+def dispatching_row_kernels():
+    baseball_df = read_baseball_stats().copy()
+
+    # Every registered kernel runs as whole-column NumPy operations by default
+    for name in ['calc_win_perc', 'calc_run_diff', 'text_playoffs', 'predict_win_perc']:
+        results_np = apply_row_kernel(name, baseball_df)
+
+        # The row-wise path is kept to validate the vectorized one
+        results_loop = apply_row_kernel(name, baseball_df, vectorized=False)
+        print(name, np.array_equal(results_np, results_loop))
+
+    baseball_df['WP_preds'] = apply_row_kernel('predict_win_perc', baseball_df)
+    print(baseball_df.head())
+
+
+# Set in each worker process by attach_shared_stats()
+shared_stats = {}
+shared_stats_memory = None
+
+
+def share_baseball_stats(columns=('RS', 'RA', 'W', 'G')):
+    """
+    Copy the stat columns of baseball_stats.csv into one block of shared memory.
+
+    Returns the SharedMemory block, which the caller must close() and unlink() when the workers are done, and the
+    arguments attach_shared_stats() needs to view it from another process.
+    """
+    baseball_df = read_baseball_stats()
+    stats = np.stack([baseball_df[column].to_numpy(dtype=np.float64) for column in columns])
+    memory = shared_memory.SharedMemory(create=True, size=stats.nbytes)
+    np.ndarray(stats.shape, dtype=stats.dtype, buffer=memory.buf)[:] = stats
+    return memory, (memory.name, stats.shape, stats.dtype.str, columns)
+
+
+def attach_shared_stats(name, shape, dtype, columns):
+    """
+    Pool initializer: map the shared stats block into this worker as zero-copy NumPy views, one per column.
+    """
+    global shared_stats_memory
+    shared_stats_memory = shared_memory.SharedMemory(name=name)
+    stats = np.ndarray(shape, dtype=dtype, buffer=shared_stats_memory.buf)
+    shared_stats.update(zip(columns, stats))
+
+
+def win_perc_prediction_error(exponent):
+    # Mean absolute error of the Pythagorean prediction for one exponent, read from the shared columns
+    predictions = predict_win_perc(shared_stats['RS'], shared_stats['RA'], exponent)
+    actual = calc_win_perc(shared_stats['W'], shared_stats['G'])
+    return np.abs(predictions - actual).mean()
+
+
+def what_if_pythagorean_exponents(exponents, max_workers=None):
+    """
+    Score many Pythagorean exponents in a process pool without every worker re-reading baseball_stats.csv.
+    """
+    memory, shared_args = share_baseball_stats()
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=attach_shared_stats, initargs=shared_args) as executor:
+            return dict(zip(exponents, executor.map(win_perc_prediction_error, exponents)))
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+def what_if_modelling_with_shared_memory():
+    # Try exponents between 1.5 and 2.5 and keep the one with the smallest error
+    exponents = np.round(np.arange(1.5, 2.5, 0.05), 2)
+    errors = what_if_pythagorean_exponents(exponents)
+    best_exponent = min(errors, key=errors.get)
+    print(best_exponent, errors[best_exponent])
+
+
 def main():
     # iterating_with_iterrows()
     # run_differentials_with_iterrows()
@@ -287,7 +445,9 @@ def main():
     # analyzing_baseball_stats_with_apply()
     # settle_a_debate_with_apply()
     # replacing_iloc_with_underlying_arrays()
-    bringing_it_all_together_predict_win_percentage()
+    # bringing_it_all_together_predict_win_percentage()
+    # dispatching_row_kernels()
+    what_if_modelling_with_shared_memory()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,151 @@
+"""
+Benchmark for the pandas iteration patterns in video-notes__basic-pandas-optimization.py, run on the real row
+functions and row kernels of basic-pandas-optimization.py.
+
+The iteration patterns (iloc, iterrows, itertuples, apply and NumPy arrays) call calc_win_perc(), calc_run_diff() and
+predict_win_perc() exactly as they are defined there, and every kernel registered with row_kernel() is timed through
+apply_row_kernel(), both vectorized and row by row. A change to any of them shows up here.
+
+Every variant runs on synthetic tables built by sampling rows of baseball_stats.csv, from 1e2 up to 1e7 rows. For each
+size we record the best wall time over a few repeats, the throughput in rows per second and the peak memory allocated
+by a separate traced run. The scaling exponent is the slope of log(time) against log(rows), so ~1.0 means linear.
+Results are printed and saved as JSON.
+"""
+import importlib.util
+import json
+import time
+import tracemalloc
+
+import numpy as np
+
+spec = importlib.util.spec_from_file_location('basic', 'basic-pandas-optimization.py')
+basic = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(basic)
+calc_win_perc = basic.calc_win_perc
+calc_run_diff = basic.calc_run_diff
+predict_win_perc = basic.predict_win_perc
+
+
+def win_perc_with_iloc(baseball_df):
+    win_perc_list = []
+    for i in range(len(baseball_df)):
+        row = baseball_df.iloc[i]
+        win_perc_list.append(calc_win_perc(row['W'], row['G']))
+    return win_perc_list
+
+
+def win_perc_with_iterrows(baseball_df):
+    win_perc_list = []
+    for i, row in baseball_df.iterrows():
+        win_perc_list.append(calc_win_perc(row['W'], row['G']))
+    return win_perc_list
+
+
+def win_perc_with_itertuples(baseball_df):
+    win_perc_list = []
+    for row in baseball_df.itertuples():
+        win_perc_list.append(calc_win_perc(row.W, row.G))
+    return win_perc_list
+
+
+def run_diff_with_iterrows(baseball_df):
+    run_diffs = []
+    for i, row in baseball_df.iterrows():
+        run_diffs.append(calc_run_diff(row['RS'], row['RA']))
+    return run_diffs
+
+
+def run_diff_with_apply(baseball_df):
+    return baseball_df.apply(lambda row: calc_run_diff(row['RS'], row['RA']), axis=1)
+
+
+def run_diff_with_numpy(baseball_df):
+    return basic.calc_run_diff_np(baseball_df['RS'].values, baseball_df['RA'].values)
+
+
+def win_perc_with_numpy(baseball_df):
+    return calc_win_perc(baseball_df['W'].values, baseball_df['G'].values)
+
+
+def win_perc_preds_with_itertuples(baseball_df):
+    return [predict_win_perc(row.RS, row.RA) for row in baseball_df.itertuples()]
+
+
+def win_perc_preds_with_numpy(baseball_df):
+    return predict_win_perc(baseball_df['RS'].values, baseball_df['RA'].values)
+
+
+def kernel_variant(name, vectorized):
+    def run_kernel(baseball_df):
+        return basic.apply_row_kernel(name, baseball_df, vectorized=vectorized)
+    return run_kernel
+
+
+# Variant name -> (function, largest table size it is run on); the row loops are capped so the suite finishes
+variants = {
+    'adding_win_percentage_to_dataframe_with_iloc': (win_perc_with_iloc, 10 ** 4),
+    'adding_win_percentage_to_dataframe_with_iterrows': (win_perc_with_iterrows, 10 ** 5),
+    'another_iterator_method_itertuples': (win_perc_with_itertuples, 10 ** 6),
+    'run_differentials_with_a_loop': (run_diff_with_iterrows, 10 ** 5),
+    'run_differentials_with_apply': (run_diff_with_apply, 10 ** 5),
+    'optimal_pandas_iterating': (run_diff_with_numpy, 10 ** 7),
+    'win_percentage_with_numpy': (win_perc_with_numpy, 10 ** 7),
+    'predict_win_percentage_with_itertuples': (win_perc_preds_with_itertuples, 10 ** 6),
+    'predict_win_percentage_with_numpy': (win_perc_preds_with_numpy, 10 ** 7),
+}
+for kernel_name in basic.row_kernels:
+    variants['row_kernel_{}_vectorized'.format(kernel_name)] = (kernel_variant(kernel_name, True), 10 ** 7)
+    variants['row_kernel_{}_rows'.format(kernel_name)] = (kernel_variant(kernel_name, False), 10 ** 6)
+
+
+def synthetic_baseball_df(n_rows, seed=42):
+    # Resample real team seasons, typed like read_baseball_stats(), so the values look like the course data
+    baseball_df = basic.read_baseball_stats()[['Team', 'Year', 'RS', 'RA', 'W', 'G', 'Playoffs']]
+    return baseball_df.sample(n_rows, replace=True, random_state=seed).reset_index(drop=True)
+
+
+def time_variant(func, baseball_df, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(baseball_df)
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(baseball_df)
+    peak_bytes = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return min(timings), peak_bytes
+
+
+def run_benchmarks(sizes=tuple(10 ** exponent for exponent in range(2, 8)), repeat=3):
+    results = {name: {'runs': []} for name in variants}
+
+    for n_rows in sizes:
+        baseball_df = synthetic_baseball_df(n_rows)
+        for name, (func, max_rows) in variants.items():
+            if n_rows > max_rows:
+                continue
+            # Big tables are only timed once, a single run is already long enough to be stable
+            seconds, peak_bytes = time_variant(func, baseball_df, repeat if n_rows <= 10 ** 5 else 1)
+            results[name]['runs'].append({'rows': n_rows,
+                                          'seconds': seconds,
+                                          'rows_per_second': n_rows / seconds,
+                                          'peak_bytes': peak_bytes})
+
+    for name, result in results.items():
+        rows = [run['rows'] for run in result['runs']]
+        seconds = [run['seconds'] for run in result['runs']]
+        result['scaling_exponent'] = float(np.polyfit(np.log(rows), np.log(seconds), 1)[0]) if len(rows) > 1 else None
+    return results
+
+
+def main():
+    results = run_benchmarks()
+    print(json.dumps(results, indent=2))
+    with open('basic-pandas-optimization-benchmark.json', 'w') as f:
+        json.dump(results, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
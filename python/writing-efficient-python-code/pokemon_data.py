@@ -0,0 +1,50 @@
+"""
+The large Pokémon dataset used by gaining-efficiencies.py and video-notes__gaining-efficiencies.py.
+
+The data lives in pokemon.npz next to this file and is only read the first time it is asked for, either through
+load_pokemon_data() or as an attribute of a script that forwards its module __getattr__ here.
+"""
+import os
+
+import numpy as np
+
+pokemon_data_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pokemon.npz')
+pokemon_data_keys = ['names', 'primary_types', 'generations', 'gen1_gen2_name_lengths_loop', 'poke_list', 'stats', 'hps']
+pokemon_aliases = {'poke_names': 'names', 'pokemon_types': 'primary_types', 'poke_gens': 'generations'}
+loaded_data = {}
+
+
+def load_pokemon_data(*keys):
+    """
+    Return the requested parts of the Pokémon dataset, reading pokemon.npz on the first call.
+
+    Args:
+        *keys: Names from pokemon_data_keys, or one of their aliases in pokemon_aliases.
+
+    Returns:
+        tuple: One value per key, in the order asked for, so a single key is unpacked with
+        `generations, = load_pokemon_data('generations')`.
+    """
+    if not loaded_data:
+        with np.load(pokemon_data_path) as npz:
+            loaded_data['names'] = npz['names'].tolist()
+            loaded_data['primary_types'] = npz['primary_types'].tolist()
+            loaded_data['generations'] = npz['generations'].tolist()
+            loaded_data['gen1_gen2_name_lengths_loop'] = [*zip(npz['gen1_gen2_names'].tolist(),
+                                                               npz['gen1_gen2_name_lengths'].tolist())]
+            loaded_data['poke_list'] = [*zip(npz['poke_list_names'].tolist(),
+                                             npz['poke_list_totals'].tolist(),
+                                             npz['poke_list_averages'].tolist())]
+            loaded_data['stats'] = npz['stats']
+            loaded_data['hps'] = npz['hps']
+
+    return tuple(loaded_data[pokemon_aliases.get(key, key)] for key in keys)
+
+
+def module_getattr(module_name):
+    """Build a module __getattr__ that serves the dataset names (and their aliases) as module attributes"""
+    def __getattr__(name):
+        if name in pokemon_data_keys or name in pokemon_aliases:
+            return load_pokemon_data(name)[0]
+        raise AttributeError(f'module {module_name!r} has no attribute {name!r}')
+    return __getattr__
@@ -0,0 +1,131 @@
+"""
+Decorator overhead benchmark, built on the idea of measuring_decorator_overhead() in more-on-decorators.py.
+
+Timing one call with time.time() can't see a wrapper that costs a few hundred nanoseconds. Instead, every decorator
+(and a few stacks of them) wraps the same trivial function, which is then called many times in a row with
+perf_counter_ns(). The per-call overhead is the decorated time minus the undecorated time, divided by the number of
+calls, taking the best of several repeats to filter out noise. The decorators are the real objects from
+more-on-decorators.py and video-notes__more-on-decorators.py, so a change to any of them shows up here.
+
+Results are saved to decorator-overhead-benchmark.json. If decorator-overhead-baseline.json exists (copy a results
+file there to make it the baseline), any decorator whose overhead grew by more than the allowed tolerance is reported
+and the script exits with status 1, so it can gate changes to the decorators.
+"""
+import importlib.util
+import json
+import os
+import sys
+import time
+from contextlib import redirect_stdout
+
+
+def load_script(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+video_notes = load_script('video_notes', 'video-notes__more-on-decorators.py')
+exercises = load_script('more_on_decorators', 'more-on-decorators.py')
+
+
+def stack(*decorators):
+    # stack(a, b)(func) is the same as decorating func with @a then @b on the lines below
+    def decorator(func):
+        for dec in reversed(decorators):
+            func = dec(func)
+        return func
+    return decorator
+
+
+# Decorator name -> decorator to apply to the benchmarked function
+decorators = {
+    'print_return_type': exercises.print_return_type,
+    'counter': exercises.counter,
+    'add_hello': exercises.add_hello,
+    'timer': video_notes.timer,
+    'memoize': video_notes.memoize,
+    'run_n_times(3)': video_notes.run_n_times(3),
+    'timeout(1)': video_notes.timeout(1),
+    'tag': video_notes.tag('test'),
+    'returns(int)': video_notes.returns(int),
+    'memoize_lru()': video_notes.memoize_lru(),
+    'memoize_lru(ttl=60)': video_notes.memoize_lru(ttl=60),
+    'memoize_lru(make_key=structural_key)': video_notes.memoize_lru(make_key=video_notes.structural_key),
+    'timed': video_notes.timed,
+    'counted': exercises.counted,
+    'check_sampled(0.01)': exercises.check_sampled(0.01),
+    'check_sampled(1.0)': exercises.check_sampled(1.0),
+    'deadline(1)': video_notes.deadline(1),
+    'timer + memoize': stack(video_notes.timer, video_notes.memoize),
+    'memoize + returns(int)': stack(video_notes.memoize, video_notes.returns(int)),
+    'counter + timeout(1)': stack(exercises.counter, video_notes.timeout(1)),
+    'tag + returns(int) + counter': stack(video_notes.tag('test'), video_notes.returns(int), exercises.counter),
+    'timed + counted + memoize_lru()': stack(video_notes.timed, exercises.counted, video_notes.memoize_lru()),
+}
+
+# deadline() starts a thread per call, so it gets fewer calls to keep the suite short
+call_counts = {'deadline(1)': 2000}
+
+
+def identity(x):
+    return x
+
+
+def time_calls(func, n_calls, repeat):
+    # Best total time, in nanoseconds, of n_calls calls
+    best = None
+    for _ in range(repeat):
+        t_start = time.perf_counter_ns()
+        for i in range(n_calls):
+            func(1)
+        t_total = time.perf_counter_ns() - t_start
+        best = t_total if best is None else min(best, t_total)
+    return best
+
+
+def run_benchmarks(n_calls=100000, repeat=5):
+    results = {}
+    # Decorators that print would flood the terminal, so their output goes nowhere
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        baseline_ns = time_calls(identity, n_calls, repeat)
+        for name, decorator in decorators.items():
+            calls = call_counts.get(name, n_calls)
+            decorated_ns = time_calls(decorator(identity), calls, repeat)
+            results[name] = {'overhead_ns_per_call': decorated_ns / calls - baseline_ns / n_calls,
+                             'ns_per_call': decorated_ns / calls}
+    results['undecorated'] = {'overhead_ns_per_call': 0.0, 'ns_per_call': baseline_ns / n_calls}
+    return results
+
+
+def find_regressions(results, baseline, tolerance=0.5, min_ns=100):
+    """Return the decorators whose overhead grew by more than tolerance (relative) and min_ns (absolute) per call"""
+    regressions = {}
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['overhead_ns_per_call']
+        after = result['overhead_ns_per_call']
+        if after - before > max(min_ns, tolerance * before):
+            regressions[name] = {'baseline_ns': before, 'current_ns': after}
+    return regressions
+
+
+def main():
+    results = run_benchmarks()
+    for name, result in results.items():
+        print('{:30} {:10.1f} ns overhead per call'.format(name, result['overhead_ns_per_call']))
+    with open('decorator-overhead-benchmark.json', 'w') as f:
+        json.dump(results, f, indent=2)
+
+    if os.path.exists('decorator-overhead-baseline.json'):
+        with open('decorator-overhead-baseline.json') as f:
+            regressions = find_regressions(results, json.load(f))
+        if regressions:
+            print('Overhead regressions:', json.dumps(regressions, indent=2))
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,19 +1,26 @@
 import numpy as np
+import os
 import pandas as pd
+import random
+import threading
+import weakref
+from collections import deque
+from functools import wraps
 
 
-def print_the_return_type_example():
-    def print_return_type(func):
-        # Define wrapper(), the decorated function
-        def wrapper(*args, **kwargs):
-            # Call the function being decorated
-            result = func(*args, **kwargs)
-            print('{}() returned type {}'.format(func.__name__, type(result)))
-            return result
+def print_return_type(func):
+    # Define wrapper(), the decorated function
+    def wrapper(*args, **kwargs):
+        # Call the function being decorated
+        result = func(*args, **kwargs)
+        print('{}() returned type {}'.format(func.__name__, type(result)))
+        return result
 
-        # Return the decorated function
-        return wrapper
+    # Return the decorated function
+    return wrapper
 
+
+def print_the_return_type_example():
     @print_return_type
     def foo(value):
         return value
@@ -23,17 +30,18 @@ def print_the_return_type_example():
     print(foo({'a': 42}))
 
 
-def counter_example():
-    def counter(func):
-        def wrapper(*args, **kwargs):
-            wrapper.count += 1
-            # Call the function being decorated and return the result
-            return func(*args, **kwargs)
+def counter(func):
+    def wrapper(*args, **kwargs):
+        wrapper.count += 1
+        # Call the function being decorated and return the result
+        return func(*args, **kwargs)
+
+    wrapper.count = 0
+    # Return the new decorated function
+    return wrapper
 
-        wrapper.count = 0
-        # Return the new decorated function
-        return wrapper
 
+def counter_example():
     # Decorate foo() with the counter() decorator
     @counter
     def foo():
@@ -53,19 +61,105 @@ def counter_example():
     """
 
 
-def preserving_docstrings_when_decorating_functions1():
-    from functools import wraps
+# Function name -> list of [calls, errors] slots of threads that may still be running
+call_counter_registry = {}
+# Function name -> [calls, errors] added up over every thread that has exited
+exited_thread_counts = {}
+call_counter_registry_lock = threading.Lock()
+# (function name, slot) of exited threads, queued by a weakref.finalize() on the thread. The finalizer can run in any
+# thread, even one holding call_counter_registry_lock, so it only appends here and merge_exited_thread_counts() folds
+# the slots into exited_thread_counts later, under the lock.
+exited_thread_slots = deque()
+thread_call_counts = threading.local()
 
-    def add_hello(func):
-        # Decorate wrapper() so that it keeps func()'s metadata
-        @wraps(func)
-        def wrapper(*args, **kwargs):
-            """Print 'hello' and then call the decorated function."""
-            print('Hello')
+
+def merge_exited_thread_counts():
+    # Call with call_counter_registry_lock held
+    while exited_thread_slots:
+        name, slot = exited_thread_slots.popleft()
+        total = exited_thread_counts.setdefault(name, [0, 0])
+        total[0] += slot[0]
+        total[1] += slot[1]
+        call_counter_registry[name].remove(slot)
+
+
+def counted(func):
+    """Count calls to func, and calls that raised, in a registry that call_counts_snapshot() can read
+
+    Unlike counter() this is safe with many threads: each thread only ever increments its own slot, so there is no
+    lock on the hot path, and the slots are added up when the snapshot is taken. A thread's slot is folded into a
+    per-function total once the thread is gone, so short-lived threads don't pile up slots.
+    """
+    name = '{}.{}'.format(func.__module__, func.__qualname__)
+    slots = call_counter_registry.setdefault(name, [])
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        slot = thread_call_counts.__dict__.get(name)
+        if slot is None:
+            slot = thread_call_counts.__dict__[name] = [0, 0]
+            weakref.finalize(threading.current_thread(), exited_thread_slots.append, (name, slot))
+            with call_counter_registry_lock:
+                merge_exited_thread_counts()
+                slots.append(slot)
+        slot[0] += 1
+        try:
             return func(*args, **kwargs)
+        except Exception:
+            slot[1] += 1
+            raise
+
+    return wrapper
 
-        return wrapper
 
+def call_counts_snapshot():
+    """Return {function name: {'calls': ..., 'errors': ...}} for every counted function"""
+    # Add up while holding the lock, so a thread exiting meanwhile can't be counted twice: once in its own slot and
+    # again after it was folded into exited_thread_counts
+    snapshot = {}
+    with call_counter_registry_lock:
+        merge_exited_thread_counts()
+        for name, slots in call_counter_registry.items():
+            slots = slots + [exited_thread_counts.get(name, [0, 0])]
+            snapshot[name] = {'calls': sum(slot[0] for slot in slots), 'errors': sum(slot[1] for slot in slots)}
+    return snapshot
+
+
+def counted_example():
+    @counted
+    def foo(x):
+        if x % 10 == 0:
+            raise ValueError(x)
+
+    def worker():
+        for x in range(1, 1001):
+            try:
+                foo(x)
+            except ValueError:
+                pass
+
+    # Eight threads call foo() 1000 times each, 100 of which raise
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(call_counts_snapshot())
+
+
+def add_hello(func):
+    # Decorate wrapper() so that it keeps func()'s metadata
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        """Print 'hello' and then call the decorated function."""
+        print('Hello')
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def preserving_docstrings_when_decorating_functions1():
     # Decorate print_sum() with the add_hello() decorator
     @add_hello
     def print_sum(a, b):
@@ -104,6 +198,48 @@ def check_everything(func):
     return wrapper
 
 
+def check_inputs_vectorized(a, *args, **kwargs):
+    # Check the whole input in one NumPy operation instead of element by element
+    if not np.isfinite(np.asarray(a, dtype=float)).all():
+        raise ValueError('inputs must all be finite numbers')
+
+
+def check_outputs_vectorized(a, *args, **kwargs):
+    if not np.isfinite(np.asarray(a, dtype=float)).all():
+        raise ValueError('outputs must all be finite numbers')
+
+
+# check_sampled() reads this when it decorates a function, not when the function is called. Decorators usually run as
+# their module is imported, so turn validation off with VALIDATION_ENABLED=0 in the environment, or set this to False
+# before importing the modules whose functions should go unchecked; changing it afterwards has no effect on them.
+validation_enabled = os.environ.get('VALIDATION_ENABLED', '1') != '0'
+
+
+def check_sampled(sample_rate=0.01, check_inputs=check_inputs_vectorized, check_outputs=check_outputs_vectorized):
+    """Like check_everything(), but only validate a random sample_rate fraction of calls
+
+    The default checks validate a whole batch (list or array) of values with one vectorized NumPy call. If
+    validation_enabled is False when a function is decorated, the function is returned undecorated, so switching
+    validation off costs nothing per call. Functions decorated before the switch is flipped keep their checks.
+    """
+    def decorator(func):
+        if not validation_enabled:
+            return func
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if random.random() >= sample_rate:
+                return func(*args, **kwargs)
+            check_inputs(*args, **kwargs)
+            result = func(*args, **kwargs)
+            check_outputs(result)
+            return result
+
+        return wrapper
+
+    return decorator
+
+
 def measuring_decorator_overhead():
     import time
     @check_everything
@@ -126,11 +262,39 @@ def measuring_decorator_overhead():
     print('Undecorated time: {:.5f}s'.format(undecorated_time))
 
 
+def measuring_sampled_validation_overhead():
+    import time
+
+    def duplicate(my_list):
+        """Return a new list that repeats the input twice"""
+        return my_list + my_list
+
+    # Keep the original function to compare against: with validation off, check_sampled() returns it unchanged and
+    # there is no __wrapped__ to reach it through
+    sampled_duplicate = check_sampled(sample_rate=0.1)(duplicate)
+
+    # 1000 calls, of which about 100 are validated with one vectorized check each
+    t_start = time.perf_counter()
+    for _ in range(1000):
+        duplicated_list = sampled_duplicate(list(range(50)))
+    sampled_time = time.perf_counter() - t_start
+
+    t_start = time.perf_counter()
+    for _ in range(1000):
+        duplicated_list = duplicate(list(range(50)))
+    undecorated_time = time.perf_counter() - t_start
+
+    print('Sampled validation time: {:.5f}s'.format(sampled_time))
+    print('Undecorated time: {:.5f}s'.format(undecorated_time))
+
+
 def main():
     # print_the_return_type_example()
     # counter_example()
+    # counted_example()
     # preserving_docstrings_when_decorating_functions1()
     measuring_decorator_overhead()
+    # measuring_sampled_validation_overhead()
 
 
 if __name__ == '__main__':
@@ -1,17 +1,141 @@
+import asyncio
+import hashlib
+import inspect
 import numpy as np
 import pandas as pd
+import pickle
+import sqlite3
+import threading
 import time
+import weakref
+from concurrent import futures
+from contextlib import closing
+from collections import OrderedDict, deque
+from functools import wraps
 
 
 # Utility function to hash dictionary in memoize
 def freeze(d):
     if isinstance(d, dict):
         return frozenset((key, freeze(value)) for key, value in d.items())
-    elif isinstance(d, list):
+    elif isinstance(d, (list, tuple)):
         return tuple(freeze(value) for value in d)
     return d
 
 
+# Hashes of frozen arrays by id(). Each entry keeps a weak reference to its array, so the cache doesn't keep big arrays
+# alive and an entry whose id was reused by a new object is recognised as stale.
+structural_hash_cache = OrderedDict()
+structural_hash_cache_size = 1024
+structural_hash_cache_lock = threading.Lock()
+
+
+def is_frozen(value):
+    # True if no one can change the array's contents: it and every array it is a view of are read-only, down to a
+    # base that owns its data or is an immutable bytes object
+    while isinstance(value, np.ndarray):
+        if value.flags.writeable:
+            return False
+        value = value.base
+    return value is None or isinstance(value, bytes)
+
+
+def structural_hash(value, sample_size=None):
+    """Hash a (possibly nested) argument by its contents without copying it
+
+    NumPy arrays are hashed straight from their memory buffer, pandas objects (including Index and Categorical) with
+    hash_pandas_object() or their codes, and plain scalars by repr(). Any other object is hashed by pickling it, never
+    by its repr(), since reprs like pandas' are shortened and two different objects could get the same key. Objects
+    that can't be pickled raise TypeError.
+
+    With sample_size, only about that many evenly spaced elements or rows of each array or pandas object are hashed,
+    which is much faster on big inputs but can miss a change to an element that wasn't sampled. Hashes of frozen arrays
+    (read-only, and so is every array they are a view of) are remembered by id(), so passing the same big frozen array
+    again costs one lookup. A read-only view of a writable array can still change through its base, so it is rehashed
+    on every call, as are object arrays and tuples, since they can hold lists or arrays that change.
+
+    Args:
+        value: The object to hash. Dicts, lists, tuples and sets are hashed element by element.
+        sample_size (int): Hash roughly this many elements or rows of each array or pandas object, or None for all.
+
+    Returns:
+        str: A hex digest
+    """
+    cacheable = isinstance(value, np.ndarray) and not value.dtype.hasobject and is_frozen(value)
+    if cacheable:
+        with structural_hash_cache_lock:
+            cached = structural_hash_cache.get(id(value))
+            if cached is not None and cached[0]() is value and cached[1] == sample_size:
+                structural_hash_cache.move_to_end(id(value))
+                return cached[2]
+
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(value, np.ndarray):
+        flat = value.ravel()
+        if sample_size is not None and len(flat) > sample_size:
+            flat = flat[::len(flat) // sample_size]
+        h.update('ndarray {} {}'.format(value.dtype.str, value.shape).encode())
+        if value.dtype.hasobject:
+            h.update(''.join(structural_hash(item, sample_size) for item in flat).encode())
+        else:
+            h.update(np.ascontiguousarray(flat).view(np.uint8))
+    elif isinstance(value, (pd.DataFrame, pd.Series)):
+        h.update('{} {} {}'.format(type(value).__name__, value.shape, structural_hash(value.index.names)).encode())
+        if isinstance(value, pd.DataFrame):
+            h.update(structural_hash([*map(str, value.columns)] + [*map(str, value.dtypes)]).encode())
+        sampled = value
+        if sample_size is not None and len(value) > sample_size:
+            sampled = value.iloc[::len(value) // sample_size]
+        h.update(pd.util.hash_pandas_object(sampled).values.view(np.uint8))
+    elif isinstance(value, pd.Index):
+        h.update('{} {} {} {}'.format(
+            type(value).__name__, len(value), value.dtype, structural_hash(value.names)).encode())
+        sampled = value
+        if sample_size is not None and len(value) > sample_size:
+            sampled = value[::len(value) // sample_size]
+        h.update(pd.util.hash_pandas_object(sampled).values.view(np.uint8))
+    elif isinstance(value, pd.Categorical):
+        # The codes only mean something together with the categories they point into
+        h.update('Categorical {} {}'.format(value.ordered, structural_hash(value.categories)).encode())
+        h.update(structural_hash(value.codes, sample_size).encode())
+    elif isinstance(value, dict):
+        # Dicts with the same items are equal whatever their order, so combine the item hashes in sorted order
+        items = sorted(structural_hash((key, item), sample_size) for key, item in value.items())
+        h.update('dict {}'.format(items).encode())
+    elif isinstance(value, (set, frozenset)):
+        h.update('set {}'.format(sorted(structural_hash(item, sample_size) for item in value)).encode())
+    elif isinstance(value, (list, tuple)):
+        h.update('{} {}'.format(type(value).__name__, [structural_hash(item, sample_size) for item in value]).encode())
+    elif value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        # The repr() of these is complete, so it tells different values apart
+        h.update('{}:{!r}'.format(type(value).__name__, value).encode())
+    elif isinstance(value, np.generic):
+        h.update('{} {}'.format(type(value).__name__, value.dtype.str).encode())
+        h.update(value.tobytes() if not value.dtype.hasobject else structural_hash(value.item()).encode())
+    else:
+        try:
+            pickled = pickle.dumps(value, protocol=4)
+        except Exception as error:
+            raise TypeError('structural_hash() cannot hash a {} object: {}'.format(
+                type(value).__name__, error)) from error
+        h.update('{}.{} '.format(type(value).__module__, type(value).__qualname__).encode())
+        h.update(pickled)
+    digest = h.hexdigest()
+
+    if cacheable:
+        with structural_hash_cache_lock:
+            structural_hash_cache[id(value)] = (weakref.ref(value), sample_size, digest)
+            structural_hash_cache.move_to_end(id(value))
+            if len(structural_hash_cache) > structural_hash_cache_size:
+                structural_hash_cache.popitem(last=False)
+    return digest
+
+
+def structural_key(args, kwargs):
+    """A memoize_lru() make_key that hashes arguments with structural_hash() instead of freezing copies of them"""
+    return structural_hash((args, kwargs))
+
+
 """
 More On Decorators - Now that you understand how decorators work under the hood, this chapter gives you a bunch of real-world examples 
 of when and how you would write decorators in your own code. You will also learn advanced decorator concepts like how to preserve the 
@@ -81,11 +205,13 @@ def memoize(func):
     cache = {}
 
     def wrapper(*args, **kwargs):
+        # Freeze the arguments once and reuse the key
+        key = (freeze(args), freeze(kwargs))
         # If these arguments haven't been seen before,
-        if (freeze(args), freeze(kwargs)) not in cache:
+        if key not in cache:
             # Call func() and store the result
-            cache[(freeze(args), freeze(kwargs))] = func(*args, **kwargs)
-        return cache[(freeze(args), freeze(kwargs))]
+            cache[key] = func(*args, **kwargs)
+        return cache[key]
     return wrapper
 
 
@@ -104,6 +230,217 @@ def using_memoize():
     print(slow_function(1, 1))
 
 
+"""
+Bounded memoizing - memoize() never forgets anything, so in a long-running process the cache grows with every new set of
+arguments. memoize_lru() keeps at most maxsize results, dropping the least recently used one first, and can also expire
+results after ttl seconds.
+
+- The key is frozen once per call.
+- A lock guards the cache, and a call that misses registers an Event so that other threads asking for the same key
+  wait for that one result instead of all calling func() at once.
+- cache_info() returns the hit, miss and eviction counts and cache_clear() empties the cache.
+- Pass a backend such as SQLiteBackend to also keep results on disk, so they survive restarts and are shared by every
+  process on the machine. Disk entries are keyed by a stable hash of the frozen arguments and of the function's source,
+  so editing the function stops old results from being used.
+"""
+
+
+def stable_encoding(frozen):
+    """Turn frozen arguments into a string that is the same in every process
+
+    frozensets iterate in a different order from one process to the next, so their items are sorted first.
+    """
+    if isinstance(frozen, frozenset):
+        return 'frozenset({})'.format(sorted(stable_encoding(value) for value in frozen))
+    elif isinstance(frozen, tuple):
+        return '({})'.format(', '.join(stable_encoding(value) for value in frozen))
+    return '{}:{!r}'.format(type(frozen).__name__, frozen)
+
+
+def function_version(func):
+    """A hash of the function's source code, falling back to its bytecode when the source isn't available"""
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        source = func.__code__.co_code
+    return hashlib.sha256(source).hexdigest()
+
+
+class SQLiteBackend:
+    """Persistent memoize_lru() storage in a SQLite file
+
+    Each call opens its own connection, so one backend can be used from many threads, and many processes can share
+    the same file. Expired rows are deleted when they are read and whenever a new result is stored, so the file
+    doesn't keep growing with results nobody can use any more.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute('CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS cache_expires_at ON cache (expires_at)')
+
+    def get(self, key):
+        """Return (True, value) for a stored, unexpired key, otherwise (False, None)"""
+        now = time.time()
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn:
+            row = conn.execute('SELECT value, expires_at FROM cache WHERE key = ?', (key,)).fetchone()
+            if row is not None and row[1] is not None and row[1] <= now:
+                with conn:
+                    conn.execute('DELETE FROM cache WHERE key = ? AND expires_at <= ?', (key, now))
+                row = None
+        if row is None:
+            return False, None
+        return True, pickle.loads(row[0])
+
+    def set(self, key, value, ttl=None):
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute('DELETE FROM cache WHERE expires_at <= ?', (now,))
+            conn.execute('INSERT OR REPLACE INTO cache VALUES (?, ?, ?)', (key, pickle.dumps(value), expires_at))
+
+    def clear(self):
+        with closing(sqlite3.connect(self.path, timeout=30)) as conn, conn:
+            conn.execute('DELETE FROM cache')
+
+
+def memoize_lru(maxsize=128, ttl=None, backend=None, version=None, make_key=None):
+    """Store up to maxsize results of the decorated function, optionally for at most ttl seconds
+
+    Args:
+        maxsize (int): The most results to keep in memory, or None for no limit.
+        ttl (float): Seconds before a stored result expires, or None to keep results until evicted.
+        backend: Optional persistent store with get(key), set(key, value, ttl) and clear(), like SQLiteBackend.
+        version (str): Identifies the function's behaviour in backend keys. Defaults to a hash of its source.
+        make_key (callable): Turns (args, kwargs) into a hashable cache key. Defaults to freezing them; use
+            structural_key for functions that take big NumPy arrays or DataFrames.
+
+    Returns:
+        callable: A decorator
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        in_flight = {}
+        lock = threading.Lock()
+        stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'backend_hits': 0}
+        func_version = version or function_version(func)
+
+        def compute(key, args, kwargs):
+            if backend is None:
+                return func(*args, **kwargs)
+            backend_key = hashlib.sha256('{}.{}:{}:{}'.format(
+                func.__module__, func.__qualname__, func_version, stable_encoding(key)).encode()).hexdigest()
+            found, result = backend.get(backend_key)
+            if found:
+                with lock:
+                    stats['backend_hits'] += 1
+                return result
+            result = func(*args, **kwargs)
+            backend.set(backend_key, result, ttl)
+            return result
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (freeze(args), freeze(kwargs)) if make_key is None else make_key(args, kwargs)
+            while True:
+                with lock:
+                    if key in cache:
+                        expires_at, result = cache[key]
+                        if expires_at is None or expires_at > time.monotonic():
+                            cache.move_to_end(key)
+                            stats['hits'] += 1
+                            return result
+                        # The stored result is too old
+                        del cache[key]
+                        stats['evictions'] += 1
+                    computing = in_flight.get(key)
+                    if computing is None:
+                        computing = in_flight[key] = threading.Event()
+                        stats['misses'] += 1
+                        break
+                # Another thread is already computing this key, wait for it and look again
+                computing.wait()
+
+            try:
+                result = compute(key, args, kwargs)
+                with lock:
+                    cache[key] = (None if ttl is None else time.monotonic() + ttl, result)
+                    while maxsize is not None and len(cache) > maxsize:
+                        cache.popitem(last=False)
+                        stats['evictions'] += 1
+                return result
+            finally:
+                with lock:
+                    del in_flight[key]
+                computing.set()
+
+        def cache_info():
+            with lock:
+                return dict(stats, size=len(cache))
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+                stats.update(hits=0, misses=0, evictions=0, backend_hits=0)
+            if backend is not None:
+                backend.clear()
+
+        wrapper.cache_info = cache_info
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+def using_memoize_lru():
+    @memoize_lru(maxsize=2, ttl=60)
+    def slow_function(a, b):
+        print('Sleeping...')
+        time.sleep(1)
+        return a + b
+
+    # Five threads ask for the same result at once, but it is only computed once
+    threads = [threading.Thread(target=slow_function, args=(1, 1)) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print(slow_function.cache_info())
+
+    # A third distinct key pushes out the least recently used one
+    slow_function(1, 2)
+    slow_function(1, 3)
+    print(slow_function.cache_info())
+
+    slow_function.cache_clear()
+    print(slow_function.cache_info())
+
+
+def using_memoize_lru_on_disk():
+    @memoize_lru(backend=SQLiteBackend('slow_function_cache.sqlite'))
+    def slow_function(a, b):
+        print('Sleeping...')
+        time.sleep(5)
+        return a + b
+
+    # Only the very first run of this script sleeps, later runs find the result on disk
+    print(slow_function(1, 1))
+    print(slow_function.cache_info())
+
+
+def using_memoize_lru_with_big_arguments():
+    @memoize_lru(make_key=structural_key)
+    def column_means(df):
+        print('Computing...')
+        return df.mean()
+
+    # freeze() can't hash a DataFrame, structural_key hashes its values instead
+    df = pd.DataFrame(np.random.rand(100000, 5), columns=list('abcde'))
+    print(column_means(df))
+    print(column_means(df.copy()))
+    print(column_means.cache_info())
+
+
 """
 When to use decorators: When adding common cbehavior to multiple functions
 """
@@ -117,8 +454,6 @@ provides us with a way to pass this metadata along. It also gives us easy access
 __wrapped__ attribute. 
 """
 
-from functools import wraps
-
 
 def timer_2(func):
     """A decorator that prints how long a function took to run"""
@@ -150,6 +485,162 @@ def decorators_and_metadata():
     sleep_n_sec.__wrapped__(2)
 
 
+"""
+Timing under load - timer() prints a line for every call, which is useless when a function is called millions of times.
+timed() instead records each call's duration (from perf_counter_ns()) in a histogram, and timing_report() summarises
+every timed function on demand: call count, 50th/95th/99th percentile and maximum.
+
+- Durations go into buckets that are 1/16th of a power of two wide, so percentiles are within about 6% of the truth.
+- Every thread records into its own histogram, so calls never wait on a lock; the report merges them when it runs.
+- When a thread exits, its histograms are folded into one histogram per function, so threads that come and go don't
+  make the registry (or the report) grow.
+"""
+
+# Function name -> list of LatencyHistograms of threads that may still be running
+timing_registry = {}
+# Function name -> one LatencyHistogram with the merged calls of every thread that has exited
+exited_thread_timings = {}
+timing_registry_lock = threading.Lock()
+# (function name, histogram) of exited threads, queued by a weakref.finalize() on the thread. The finalizer can run in
+# any thread at any time, even one that holds timing_registry_lock, so it only appends here and the merge happens
+# later, under the lock, in merge_exited_thread_timings().
+exited_thread_histograms = deque()
+thread_histograms = threading.local()
+
+
+class LatencyHistogram:
+    """Counts of durations in nanoseconds, in log-linear buckets"""
+
+    def __init__(self):
+        self.counts = {}
+        self.max_ns = 0
+
+    @staticmethod
+    def bucket(ns):
+        shift = max(ns.bit_length() - 5, 0)
+        return shift * 16 + (ns >> shift)
+
+    @staticmethod
+    def bucket_floor(bucket):
+        # Smallest duration that falls in the bucket
+        shift = max(bucket // 16 - 1, 0)
+        return (bucket - shift * 16) << shift
+
+    def record(self, ns):
+        bucket = self.bucket(ns)
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def merge(self, other):
+        for bucket, count in dict(other.counts).items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.max_ns = max(self.max_ns, other.max_ns)
+
+
+def merge_exited_thread_timings():
+    # Call with timing_registry_lock held
+    while exited_thread_histograms:
+        name, histogram = exited_thread_histograms.popleft()
+        exited_thread_timings.setdefault(name, LatencyHistogram()).merge(histogram)
+        timing_registry[name].remove(histogram)
+
+
+def timed(func):
+    """A decorator that records how long each call takes for timing_report(), without printing anything
+
+    Args:
+        func (callable): The function being decorated.
+
+    Returns:
+        callable: The decorated function
+    """
+    name = '{}.{}'.format(func.__module__, func.__qualname__)
+    histograms = timing_registry.setdefault(name, [])
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        t_start = time.perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            t_total = time.perf_counter_ns() - t_start
+            histogram = thread_histograms.__dict__.get(name)
+            if histogram is None:
+                histogram = thread_histograms.__dict__[name] = LatencyHistogram()
+                weakref.finalize(threading.current_thread(), exited_thread_histograms.append, (name, histogram))
+                with timing_registry_lock:
+                    merge_exited_thread_timings()
+                    histograms.append(histogram)
+            histogram.record(t_total)
+    return wrapper
+
+
+def timing_report():
+    """Merge every thread's histograms into count, p50, p95, p99 and max (in nanoseconds) per timed function"""
+    # Merge into fresh histograms while holding the lock, so a thread exiting meanwhile can't be counted twice: once in
+    # its own histogram and again after it was folded into exited_thread_timings
+    merged_histograms = {}
+    with timing_registry_lock:
+        merge_exited_thread_timings()
+        for name, histograms in timing_registry.items():
+            merged = merged_histograms[name] = LatencyHistogram()
+            for histogram in histograms + [exited_thread_timings.get(name, LatencyHistogram())]:
+                merged.merge(histogram)
+
+    report = {}
+    for name, merged in merged_histograms.items():
+        counts, max_ns = merged.counts, merged.max_ns
+        total = sum(counts.values())
+        if not total:
+            continue
+
+        percentiles = {}
+        seen = 0
+        targets = [(50, 'p50_ns'), (95, 'p95_ns'), (99, 'p99_ns')]
+        for bucket in sorted(counts):
+            seen += counts[bucket]
+            while targets and seen >= total * targets[0][0] / 100:
+                percentiles[targets.pop(0)[1]] = min(LatencyHistogram.bucket_floor(bucket), max_ns)
+        report[name] = dict(count=total, **percentiles, max_ns=max_ns)
+    return report
+
+
+def print_timing_report():
+    for name, stats in timing_report().items():
+        print('{}: {count} calls, p50 {p50_ns}ns, p95 {p95_ns}ns, p99 {p99_ns}ns, max {max_ns}ns'.format(name, **stats))
+
+
+def start_timing_reporter(interval=60):
+    """Print the timing report every interval seconds from a background thread. Set the returned Event to stop it."""
+    stop = threading.Event()
+
+    def report_periodically():
+        while not stop.wait(interval):
+            print_timing_report()
+
+    threading.Thread(target=report_periodically, daemon=True).start()
+    return stop
+
+
+def using_timed():
+    @timed
+    def short_sleep(n):
+        time.sleep(n)
+
+    # Four threads each make 50 calls of 1-3ms; nothing is printed until we ask for the report
+    def worker():
+        for i in range(50):
+            short_sleep(0.001 * (1 + i % 3))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    print_timing_report()
+
+
 """
 Decorators that take arguments:
 
@@ -257,6 +748,7 @@ def timeout(n_seconds):
                 # Cancel Alarm
                 signal.alarm(0)
         return wrapper
+    return decorator
 
 
 @timeout_in_5s
@@ -265,6 +757,107 @@ def foobar():
     print('foo')
 
 
+"""
+Timeouts without signals - signal.alarm() only works on the main thread, only counts whole seconds, and there is only one
+alarm per process, so two timeouts clobber each other. deadline() waits on the call from the outside instead:
+
+- A regular function runs in a daemon thread of its own and the caller waits at most n_seconds (any float) for its
+  result. Python can't stop a running thread, so on timeout the caller gets TimeoutError straight away while the
+  thread runs on in the background and its result is thrown away.
+- Because every call gets a fresh thread, calls that overran their deadline can't hold up anyone else's calls. A
+  shared pool would fill up with abandoned calls, and then every deadline in the process would expire in the queue.
+- An async function is awaited with asyncio.wait_for(), which really cancels it when the deadline passes.
+- Pass your own executor to cap the number of threads or to run in processes instead. A ProcessPoolExecutor works as
+  long as func can be pickled (so wrap it with deadline(n)(func) under a new name instead of using @deadline on it).
+  The deadline then also counts the time spent waiting for a free worker, so a small pool can be exhausted by calls
+  that timed out but are still running; a call still waiting in the queue is cancelled when its deadline passes.
+"""
+
+
+def start_daemon_thread(func, *args, **kwargs):
+    # Run func in a new daemon thread and return a Future for its result, like executor.submit()
+    future = futures.Future()
+
+    def run():
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args, **kwargs))
+        except BaseException as error:
+            future.set_exception(error)
+
+    threading.Thread(target=run, name='deadline-{}'.format(func.__name__), daemon=True).start()
+    return future
+
+
+def deadline(n_seconds, executor=None):
+    """Raise TimeoutError if the decorated function takes longer than n_seconds, from any thread
+
+    Args:
+        n_seconds (float): The longest the caller will wait for a result.
+        executor (concurrent.futures.Executor): Where regular functions run. Defaults to a new daemon thread per
+            call.
+
+    Returns:
+        callable: A decorator
+    """
+    def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                try:
+                    return await asyncio.wait_for(func(*args, **kwargs), n_seconds)
+                except asyncio.TimeoutError:
+                    raise TimeoutError('{}() took longer than {}s'.format(func.__name__, n_seconds)) from None
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if executor is None:
+                future = start_daemon_thread(func, *args, **kwargs)
+            else:
+                future = executor.submit(func, *args, **kwargs)
+            try:
+                return future.result(timeout=n_seconds)
+            except futures.TimeoutError:
+                future.cancel()
+                raise TimeoutError('{}() took longer than {}s'.format(func.__name__, n_seconds)) from None
+        return wrapper
+    return decorator
+
+
+def using_deadline():
+    @deadline(0.1)
+    def slow(n):
+        time.sleep(n)
+        return n
+
+    @deadline(0.1)
+    async def slow_async(n):
+        await asyncio.sleep(n)
+        return n
+
+    # Works from worker threads, with sub-second deadlines, and several at once
+    def handle_request(n):
+        try:
+            print('slow({}) returned {}'.format(n, slow(n)))
+        except TimeoutError as error:
+            print(error)
+
+    threads = [threading.Thread(target=handle_request, args=(n,)) for n in (0.01, 0.05, 0.5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Async functions are cancelled when their deadline passes
+    try:
+        asyncio.run(slow_async(0.5))
+    except TimeoutError as error:
+        print(error)
+    print(asyncio.run(slow_async(0.01)))
+
+
 def tag(*tags):
     """Decorator to tag functions"""
     # Define a new decorator, named "decorator", to return
@@ -313,9 +906,14 @@ def check_returns_ii():
 def main():
     # using_timer()
     # using_memoize()
+    # using_memoize_lru()
+    # using_memoize_lru_on_disk()
+    # using_memoize_lru_with_big_arguments()
     # decorators_and_metadata()
+    # using_timed()
     # a_decorator_factory()
     # timeout_background_info()
+    # using_deadline()
     # tag_your_functions()
     check_returns_ii()
 